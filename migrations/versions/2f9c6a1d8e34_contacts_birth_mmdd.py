@@ -0,0 +1,34 @@
+"""contacts birth_mmdd
+
+Revision ID: 2f9c6a1d8e34
+Revises: b7e41c93d2a5
+Create Date: 2026-10-14 10:21:48.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f9c6a1d8e34'
+down_revision: Union[str, None] = 'b7e41c93d2a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('contacts', sa.Column(
+        'birth_mmdd', sa.SmallInteger(),
+        sa.Computed('CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday) AS SMALLINT)',
+                    persisted=True),
+        nullable=True))
+    op.create_index(op.f('ix_contacts_birth_mmdd'), 'contacts', ['birth_mmdd'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_contacts_birth_mmdd'), table_name='contacts')
+    op.drop_column('contacts', 'birth_mmdd')
@@ -0,0 +1,34 @@
+"""shrink verification token
+
+Revision ID: 4538dc038df4
+Revises: 5f1c2b7a9e60
+Create Date: 2026-10-14 09:45:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4538dc038df4'
+down_revision: Union[str, None] = '5f1c2b7a9e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('users', 'verification_token',
+               existing_type=sa.String(length=255),
+               type_=sa.String(length=36),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'verification_token',
+               existing_type=sa.String(length=36),
+               type_=sa.String(length=255),
+               existing_nullable=True)
@@ -0,0 +1,33 @@
+"""contacts search indexes
+
+Revision ID: 8d3b5f0e7c21
+Revises: 2f9c6a1d8e34
+Create Date: 2026-10-14 10:48:03.772614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3b5f0e7c21'
+down_revision: Union[str, None] = '2f9c6a1d8e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_user_email', 'contacts', ['user_id', 'email'], unique=True)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "CREATE INDEX ix_contacts_trgm ON contacts USING gin "
+        "((lower(first_name || ' ' || last_name || ' ' || email)) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_trgm', table_name='contacts')
+    op.drop_index('ix_contacts_user_email', table_name='contacts')
@@ -0,0 +1,33 @@
+"""users auth indexes
+
+Revision ID: b7e41c93d2a5
+Revises: 4538dc038df4
+Create Date: 2026-10-14 09:52:37.106842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e41c93d2a5'
+down_revision: Union[str, None] = '4538dc038df4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_email_covering', 'users', ['email'], unique=False,
+                    postgresql_include=['id', 'hashed_password', 'is_active', 'is_verified',
+                                        'avatar', 'created_at', 'role'])
+    op.create_index('ix_users_verification_token', 'users', ['verification_token'], unique=False,
+                    postgresql_where=sa.text('verification_token IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_verification_token', table_name='users')
+    op.drop_index('ix_users_email_covering', table_name='users')
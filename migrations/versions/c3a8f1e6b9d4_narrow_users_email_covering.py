@@ -0,0 +1,32 @@
+"""narrow users email covering index
+
+Revision ID: c3a8f1e6b9d4
+Revises: 8d3b5f0e7c21
+Create Date: 2026-10-14 11:20:04.512937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8f1e6b9d4'
+down_revision: Union[str, None] = '8d3b5f0e7c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_users_email_covering', table_name='users')
+    op.create_index('ix_users_email_covering', 'users', ['email'], unique=False,
+                    postgresql_include=['id', 'hashed_password'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_covering', table_name='users')
+    op.create_index('ix_users_email_covering', 'users', ['email'], unique=False,
+                    postgresql_include=['id', 'hashed_password', 'is_active', 'is_verified',
+                                        'avatar', 'created_at', 'role'])
@@ -1,9 +1,17 @@
-import uuid
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
+import bcrypt
 from cloudinary.uploader import upload as cloudinary_upload
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Body
-from fastapi_limiter.depends import RateLimiter
-from passlib.context import CryptContext
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Body, Request
+from sqlalchemy import bindparam, lambda_stmt, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -11,14 +19,119 @@ from src.conf.redis_client import get_redis
 from src.database.db import get_db
 from src.database.models import User
 from src.schemas import UserCreate, UserResponse, UserLogin, TokenResponse
-from src.services.auth import create_access_token, get_current_user
+from src.services.auth import create_access_token, get_current_user, invalidate_user
+from src.services.rate_limit import client_identifier, rate_limiter
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 user_router = APIRouter(prefix="/users", tags=["users"])
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Split the cores between uvicorn workers, since each one starts its own pool
+BCRYPT_POOL_SIZE = int(
+    os.getenv("BCRYPT_POOL_SIZE", max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", 1))))
+)
+
+# Created and shut down by the app lifespan; until then hashing falls back to the default executor
+_bcrypt_pool: Optional[ProcessPoolExecutor] = None
+
+# Only the columns login reads, all held by ix_users_email_covering, so the lookup can be index-only
+_LOGIN_BY_EMAIL = lambda_stmt(
+    lambda: select(User.id, User.email, User.hashed_password).where(User.email == bindparam("email"))
+)
+
+
+def start_bcrypt_pool() -> ProcessPoolExecutor:
+    """
+    Create the process pool that bcrypt hashing and verification run in.
+
+    Workers are spawned rather than forked, since by startup the process
+    already runs the log listener and executor threads.
+
+    Returns:
+        ProcessPoolExecutor: The started pool.
+    """
+    global _bcrypt_pool
+    if _bcrypt_pool is None:
+        _bcrypt_pool = ProcessPoolExecutor(
+            max_workers=BCRYPT_POOL_SIZE, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _bcrypt_pool
+
+
+def shutdown_bcrypt_pool() -> None:
+    """
+    Shut down the bcrypt process pool, waiting for running hashes to finish.
+    """
+    global _bcrypt_pool
+    if _bcrypt_pool is not None:
+        _bcrypt_pool.shutdown()
+        _bcrypt_pool = None
+
+
+async def _hash_password(password: str) -> str:
+    """
+    Hash a password with bcrypt in the process pool.
+
+    Args:
+        password (str): Plain-text password.
+
+    Returns:
+        str: bcrypt hash of the password.
+    """
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(
+        _bcrypt_pool, bcrypt.hashpw, password.encode(), bcrypt.gensalt(rounds=12)
+    )
+    return hashed.decode()
+
+
+async def _verify_password(password: str, hashed_password: str) -> bool:
+    """
+    Check a password against a bcrypt hash in the process pool.
+
+    Args:
+        password (str): Plain-text password.
+        hashed_password (str): Stored bcrypt hash.
+
+    Returns:
+        bool: True if the password matches.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, bcrypt.checkpw, password.encode(), hashed_password.encode()
+    )
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+
+async def _auth_rate_limit_identifier(request: Request) -> str:
+    """
+    Build the rate-limit key for credential endpoints from client IP, path and email.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        str: Rate-limit identifier, so each account is throttled independently.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+    email = body.get("email", "") if isinstance(body, dict) else ""
+    return f"{await client_identifier(request)}:{str(email).lower()}"
+
+
+auth_rate_limit = rate_limiter(times=5, seconds=60, identifier=_auth_rate_limit_identifier)
+# Caps one client cycling through many emails, which the per-account bucket alone never sees
+auth_ip_rate_limit = rate_limiter(times=20, seconds=60, identifier=client_identifier)
+
+
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(auth_ip_rate_limit), Depends(auth_rate_limit)],
+)
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user in the system.
@@ -33,33 +146,29 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If user already exists (409).
     """
-    result = await db.execute(select(User).where(User.email == user.email))
-    existing_user = result.scalar_one_or_none()
-    if existing_user:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User already exists")
-    hashed_password = pwd_context.hash(user.password)
-    verification_token = str(uuid.uuid4())
-    new_user = User(
-        email=user.email,
-        hashed_password=hashed_password,
-        is_verified=False,
-        verification_token=verification_token,
-        role='user'  # Set default role
+    hashed_password = await _hash_password(user.password)
+    verification_token = secrets.token_urlsafe(16)
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=user.email,
+            hashed_password=hashed_password,
+            is_verified=False,
+            verification_token=verification_token,
+            role='user'  # Set default role
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(
+            User.id, User.email, User.is_active, User.avatar, User.created_at, User.is_verified, User.role
+        )
     )
-    db.add(new_user)
+    new_user = (await db.execute(stmt)).first()
+    if new_user is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User already exists")
     await db.commit()
-    await db.refresh(new_user)
     # log the verif link to mock email sending
-    print(f"[DEBUG] Email verification link: http://localhost:8000/auth/verify-email?token={verification_token}")
-    return UserResponse(
-        id=new_user.id,
-        email=new_user.email,
-        is_active=new_user.is_active,
-        avatar=new_user.avatar,
-        created_at=new_user.created_at,
-        is_verified=new_user.is_verified,
-        role=new_user.role  # Pass role to response
-    )
+    logger.info("Email verification link: http://localhost:8000/auth/verify-email?token=%s", verification_token)
+    return new_user
 
 @router.get("/verify-email")
 async def verify_email(token: str, db: AsyncSession = Depends(get_db)):
@@ -76,16 +185,24 @@ async def verify_email(token: str, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If token is invalid or expired (400).
     """
-    result = await db.execute(select(User).where(User.verification_token == token))
-    user = result.scalar_one_or_none()
-    if not user:
+    result = await db.execute(
+        update(User)
+        .where(User.verification_token == token)
+        .values(is_verified=True, verification_token=None)
+        .returning(User.id)
+    )
+    user_id = result.scalar()
+    if user_id is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired token")
-    user.is_verified = True
-    user.verification_token = None
     await db.commit()
+    await invalidate_user(user_id)
     return {"message": "Email verified successfully"}
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(auth_ip_rate_limit), Depends(auth_rate_limit)],
+)
 async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     Authenticate user and return JWT access token.
@@ -100,14 +217,14 @@ async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If credentials are invalid (401).
     """
-    result = await db.execute(select(User).where(User.email == user.email))
-    db_user = result.scalar_one_or_none()
-    if not db_user or not pwd_context.verify(user.password, db_user.hashed_password):
+    result = await db.execute(_LOGIN_BY_EMAIL, {"email": user.email})
+    db_user = result.first()
+    if not db_user or not await _verify_password(user.password, db_user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     access_token = create_access_token({"sub": str(db_user.id), "email": db_user.email})
     return TokenResponse(access_token=access_token)
 
-@router.get("/me", response_model=UserResponse, dependencies=[Depends(RateLimiter(times=5, seconds=60))])
+@router.get("/me", response_model=UserResponse, dependencies=[Depends(rate_limiter(times=5, seconds=60))])
 async def get_me(current_user: User = Depends(get_current_user)):
     """
     Get current authenticated user's profile.
@@ -118,14 +235,7 @@ async def get_me(current_user: User = Depends(get_current_user)):
     Returns:
         UserResponse: User profile data.
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        is_active=current_user.is_active,
-        avatar=current_user.avatar,
-        created_at=current_user.created_at,
-        is_verified=current_user.is_verified
-    )
+    return current_user
 
 @user_router.post("/avatar", status_code=201)
 async def update_avatar(
@@ -150,46 +260,57 @@ async def update_avatar(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only administrators can change their avatar themselves.")
     try:
-        result = cloudinary_upload(file.file, folder="avatars")
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, functools.partial(cloudinary_upload, file.file, folder="avatars", resource_type="image")
+        )
         avatar_url = result.get("secure_url")
         if not avatar_url:
             raise HTTPException(status_code=400, detail="Error uploading file to Cloudinary")
-        current_user.avatar = avatar_url
+        # current_user may be rebuilt from cache and detached, so write the row directly
+        await db.execute(update(User).where(User.id == current_user.id).values(avatar=avatar_url))
         await db.commit()
-        await db.refresh(current_user)
+        await invalidate_user(current_user.id)
         return {"avatar": avatar_url}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/request-password-reset", status_code=status.HTTP_200_OK)
+@router.post(
+    "/request-password-reset",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(auth_rate_limit)],
+)
 async def request_password_reset(email: str = Body(..., embed=True)):
     """
     Request password reset. Generates a token, saves it in Redis, and logs email sending (mock).
     """
     redis = await get_redis()
-    token = str(uuid.uuid4())
+    token = secrets.token_urlsafe(16)
     await redis.set(f"reset:{token}", email, ex=3600)  # Token valid for 1 hour
     # Here you can send email, but for testing just log
-    print(f"[MOCK EMAIL] To reset your password, go to: /auth/reset-password?token={token}")
+    logger.info("[MOCK EMAIL] To reset your password, go to: /auth/reset-password?token=%s", token)
     return {"msg": "Password reset instructions sent to email (mock)"}
 
-@router.post("/reset-password", status_code=status.HTTP_200_OK)
+@router.post(
+    "/reset-password",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(auth_rate_limit)],
+)
 async def reset_password(token: str = Body(...), new_password: str = Body(...), db: AsyncSession = Depends(get_db)):
     """
     Reset password by token. Checks token, updates user's password.
     """
     redis = await get_redis()
-    email = await redis.get(f"reset:{token}")
+    email = await redis.getdel(f"reset:{token}")
     if not email:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired password reset token")
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
-    if not user:
+    hashed_password = await _hash_password(new_password)
+    result = await db.execute(
+        update(User).where(User.email == email.decode()).values(hashed_password=hashed_password).returning(User.id)
+    )
+    user_id = result.scalar()
+    if user_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    from passlib.context import CryptContext
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    user.hashed_password = pwd_context.hash(new_password)
     await db.commit()
-    await db.refresh(user)
-    await redis.delete(f"reset:{token}")
+    await invalidate_user(user_id)
     return {"msg": "Password successfully reset"}
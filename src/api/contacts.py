@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from src.database.db import get_db
 from src.schemas import (
+    CONTACT_LIST_ADAPTER,
     ContactCreate,
     ContactUpdate,
     ContactResponse,
@@ -15,6 +17,27 @@ from src.services.contacts import ContactService
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
+def _contact_list_response(page: dict) -> ORJSONResponse:
+    """
+    Serialise a page of contacts without FastAPI's per-item response validation.
+
+    Args:
+        page (dict): Page with total_count, skip, limit and contacts (ORM rows).
+
+    Returns:
+        ORJSONResponse: Response body matching ContactListResponse.
+    """
+    contacts = CONTACT_LIST_ADAPTER.validate_python(page["contacts"], from_attributes=True)
+    return ORJSONResponse(
+        {
+            "total_count": page["total_count"],
+            "skip": page["skip"],
+            "limit": page["limit"],
+            "contacts": CONTACT_LIST_ADAPTER.dump_python(contacts, mode="json"),
+        }
+    )
+
+
 @router.post(
     "/",
     response_model=ContactResponse,
@@ -71,9 +94,10 @@ async def get_contacts(
         ContactListResponse: List of contacts.
     """
     service = ContactService(db)
-    return await service.get_contacts(
+    page = await service.get_contacts(
         skip, limit, first_name, last_name, email, user_id=current_user.id
     )
+    return _contact_list_response(page)
 
 
 @router.get("/birthdays/", response_model=ContactListResponse)
@@ -100,7 +124,8 @@ async def get_upcoming_birthdays(
         ContactListResponse: List of contacts with upcoming birthdays.
     """
     service = ContactService(db)
-    return await service.get_upcoming_birthdays(days, skip, limit, user_id=current_user.id)
+    page = await service.get_upcoming_birthdays(days, skip, limit, user_id=current_user.id)
+    return _contact_list_response(page)
 
 
 @router.patch(
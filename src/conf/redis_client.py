@@ -1,12 +1,29 @@
+import asyncio
 import redis.asyncio as redis_asyncio
 import os
 
 _redis_instance = None
+_redis_lock = asyncio.Lock()
 
 async def get_redis():
     global _redis_instance
-    if _redis_instance is None:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        _redis_instance = await redis_asyncio.from_url(redis_url, encoding="utf8", decode_responses=True)
+    if _redis_instance is not None:
+        return _redis_instance
+    async with _redis_lock:
+        if _redis_instance is None:
+            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+            _redis_instance = await redis_asyncio.from_url(
+                redis_url,
+                encoding="utf8",
+                decode_responses=False,
+                max_connections=50,
+                health_check_interval=30,
+            )
     return _redis_instance
 
+
+async def close_redis():
+    global _redis_instance
+    if _redis_instance is not None:
+        await _redis_instance.aclose()
+        _redis_instance = None
@@ -1,5 +1,3 @@
-import contextlib
-
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -23,34 +21,23 @@ class DatabaseSessionManager:
     """
 
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self._engine: AsyncEngine | None = create_async_engine(
+            url,
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            pool_use_lifo=True,
+            query_cache_size=1200,
+            connect_args={
+                "statement_cache_size": 1024,
+                "prepared_statement_cache_size": 1024,
+            },
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
-    @contextlib.asynccontextmanager
-    async def session(self):
-        """
-        Async context manager for database session.
-
-        Yields:
-            AsyncSession: SQLAlchemy async session.
-
-        Raises:
-            Exception: If session maker is not initialized.
-            SQLAlchemyError: If a database error occurs.
-        """
-        if self._session_maker is None:
-            raise Exception("Database session is not initialized")
-        session = self._session_maker()
-        try:
-            yield session
-        except SQLAlchemyError as e:
-            await session.rollback()
-            raise  # Re-raise the original error
-        finally:
-            await session.close()
-
 
 sessionmanager = DatabaseSessionManager(config.DATABASE_URL)
 
@@ -61,6 +48,18 @@ async def get_db():
 
     Yields:
         AsyncSession: SQLAlchemy async session.
+
+    Raises:
+        Exception: If session maker is not initialized.
+        SQLAlchemyError: If a database error occurs.
     """
-    async with sessionmanager.session() as session:
+    if sessionmanager._session_maker is None:
+        raise Exception("Database session is not initialized")
+    session = sessionmanager._session_maker()
+    try:
         yield session
+    except SQLAlchemyError:
+        await session.rollback()
+        raise  # Re-raise the original error
+    finally:
+        await session.close()
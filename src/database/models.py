@@ -1,4 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    String,
+    DateTime,
+    Boolean,
+    ForeignKey,
+    Index,
+    Computed,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import func
 
@@ -20,11 +32,13 @@ class Contact(Base):
         email (str): Email address (unique).
         phone_number (str): Phone number.
         birthday (datetime): Birthday (optional).
+        birth_mmdd (int): Birthday as month * 100 + day, generated by the database.
         additional_info (str): Additional information (optional).
         user_id (int): Foreign key to the user who owns the contact.
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (Index("ix_contacts_user_email", "user_id", "email", unique=True),)
 
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(50), nullable=False)
@@ -32,10 +46,36 @@ class Contact(Base):
     email = Column(String(100), unique=True, index=True, nullable=False)
     phone_number = Column(String(20), nullable=False)
     birthday = Column(DateTime, nullable=True)
+    birth_mmdd = Column(
+        SmallInteger,
+        Computed(
+            "CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday) AS SMALLINT)",
+            persisted=True,
+        ),
+        index=True,
+    )
     additional_info = Column(String(255), nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
 
+# Lower-cased "first last email" text matched by contact search; the ' ' separators
+# are literals so the query expression is identical to the trigram index expression.
+contact_search_doc = func.lower(
+    Contact.first_name
+    + literal_column("' '")
+    + Contact.last_name
+    + literal_column("' '")
+    + Contact.email
+)
+
+Index(
+    "ix_contacts_trgm",
+    contact_search_doc.label("search_doc"),
+    postgresql_using="gin",
+    postgresql_ops={"search_doc": "gin_trgm_ops"},
+)
+
+
 class User(Base):
     """
     ORM model representing a user.
@@ -53,6 +93,18 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_email_covering",
+            "email",
+            postgresql_include=["id", "hashed_password"],
+        ),
+        Index(
+            "ix_users_verification_token",
+            "verification_token",
+            postgresql_where=text("verification_token IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(100), unique=True, index=True, nullable=False)
@@ -62,5 +114,5 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     is_verified = Column(Boolean, default=False)
-    verification_token = Column(String(255), nullable=True)
+    verification_token = Column(String(36), nullable=True)
     role = Column(String(10), nullable=False, default="user")
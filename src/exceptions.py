@@ -1,6 +1,6 @@
 import logging
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import IntegrityError
 from pydantic import ValidationError
 
@@ -16,10 +16,10 @@ async def integrity_exception_handler(request: Request, exc: IntegrityError):
         exc (IntegrityError): SQLAlchemy integrity error exception.
 
     Returns:
-        JSONResponse: HTTP 400 response with error details.
+        ORJSONResponse: HTTP 400 response with error details.
     """
-    logger.error(f"Database Integrity Error: {str(exc)}")
-    return JSONResponse(
+    logger.error("Database Integrity Error: %s", exc)
+    return ORJSONResponse(
         status_code=400,
         content={"detail": "Record already exists with provided unique value."},
     )
@@ -34,10 +34,10 @@ async def general_exception_handler(request: Request, exc: Exception):
         exc (Exception): Uncaught exception.
 
     Returns:
-        JSONResponse: HTTP 500 response with error details.
+        ORJSONResponse: HTTP 500 response with error details.
     """
-    logger.error(f"General Exception Occurred: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("General Exception Occurred: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error. Please contact support."},
     )
@@ -52,12 +52,13 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
         exc (ValidationError): Pydantic validation error exception.
 
     Returns:
-        JSONResponse: HTTP 400 response with validation error details.
+        ORJSONResponse: HTTP 400 response with validation error details.
     """
-    logger.error(f"Validation Failed: {exc.errors()}")
-    return JSONResponse(
+    errors = exc.errors()
+    logger.error("Validation Failed: %s", errors)
+    return ORJSONResponse(
         status_code=400,
-        content={"detail": exc.errors()},
+        content={"detail": errors},
     )
 
 
@@ -70,11 +71,11 @@ async def not_found_exception_handler(request: Request, exc: HTTPException):
         exc (HTTPException): HTTP exception with status code 404.
 
     Returns:
-        JSONResponse: HTTP 404 response with error details.
+        ORJSONResponse: HTTP 404 response with error details.
     """
-    logger.warning(
-        f"Resource Not Found: URL={request.url} - Detail={exc.detail}")
-    return JSONResponse(
+    logger.warning("Resource Not Found: URL=%s - Detail=%s", request.url, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail or "The requested resource does not exist."},
+        headers=getattr(exc, "headers", None),
     )
@@ -1,3 +1,8 @@
+import logging
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
 from fastapi import FastAPI, HTTPException
 from src.api import contacts, auth
 from src.exceptions import (
@@ -9,20 +14,41 @@ from src.exceptions import (
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from fastapi_limiter import FastAPILimiter
-import redis.asyncio as redis_asyncio
 import os
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import cloudinary
+from src.conf.redis_client import get_redis, close_redis
 
 load_dotenv()
+
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = QueueListener(log_queue, log_handler)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
 cloudinary.config(
     cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
     api_key=os.getenv("CLOUDINARY_API_KEY"),
     api_secret=os.getenv("CLOUDINARY_API_SECRET"),
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener.start()
+    auth.start_bcrypt_pool()
+    app.state.redis = await get_redis()
+    await FastAPILimiter.init(app.state.redis)
+    yield
+    await close_redis()
+    auth.shutdown_bcrypt_pool()
+    log_listener.stop()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -46,14 +72,17 @@ async def healthchecker():
     return {"message": "The application is up and running!"}
 
 
-@app.on_event("startup")
-async def startup():
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    redis = await redis_asyncio.from_url(redis_url, encoding="utf8", decode_responses=True)
-    await FastAPILimiter.init(redis)
-
-
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+    )
@@ -4,12 +4,24 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, extract
+from sqlalchemy import func, and_, or_, delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import date, timedelta
 
-from src.database.models import Contact
+from src.database.models import Contact, contact_search_doc
 from src.schemas import ContactCreate, ContactUpdate
 
+# Columns ContactResponse needs; list queries skip user_id and birth_mmdd
+CONTACT_RESPONSE_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone_number,
+    Contact.birthday,
+    Contact.additional_info,
+)
+
 
 class ContactRepository:
     """
@@ -35,25 +47,24 @@ class ContactRepository:
         Raises:
             HTTPException: If contact with the same email already exists.
         """
-        existing_contact_stmt = select(
-            Contact).filter_by(email=contact_data.email, user_id=user_id)
-        existing_contact_result = await self.db.execute(existing_contact_stmt)
-        existing_contact = existing_contact_result.scalar_one_or_none()
-
-        if existing_contact:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Contact with email {contact_data.email} already exists.",
-            )
-
         contact_dict = contact_data.model_dump()
         contact_dict["user_id"] = user_id
-        contact = Contact(**contact_dict)
-        self.db.add(contact)
+        stmt = (
+            pg_insert(Contact)
+            .values(**contact_dict)
+            .on_conflict_do_nothing(index_elements=["user_id", "email"])
+            .returning(Contact)
+        )
 
         try:
+            result = await self.db.execute(stmt)
+            contact = result.scalar_one_or_none()
+            if contact is None:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Contact with email {contact_data.email} already exists.",
+                )
             await self.db.commit()
-            await self.db.refresh(contact)
             return contact
         except IntegrityError:
             await self.db.rollback()
@@ -85,8 +96,6 @@ class ContactRepository:
         Returns:
             dict: Dictionary with total_count, skip, limit, contacts.
         """
-        stmt = select(Contact)
-
         filters = [Contact.user_id == user_id]
         if first_name:
             filters.append(Contact.first_name.ilike(f"%{first_name}%"))
@@ -95,27 +104,7 @@ class ContactRepository:
         if email:
             filters.append(Contact.email.ilike(f"%{email}%"))
 
-        if filters:
-            stmt = stmt.where(and_(*filters))
-
-        stmt = stmt.offset(skip).limit(limit)
-
-        total_count_stmt = select(func.count()).select_from(Contact)
-        if filters:
-            total_count_stmt = total_count_stmt.where(and_(*filters))
-
-        total_count_result = await self.db.execute(total_count_stmt)
-        total_count = total_count_result.scalar()
-
-        result = await self.db.execute(stmt)
-        contacts = result.scalars().all()
-
-        return {
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit,
-            "contacts": contacts,
-        }
+        return await self._paginate(and_(*filters), skip, limit)
 
     async def get_contact_by_id(self, contact_id: int) -> Optional[Contact]:
         """
@@ -132,7 +121,7 @@ class ContactRepository:
         return result.scalar_one_or_none()
 
     async def update_contact(
-        self, contact_id: int, contact_data: ContactUpdate
+        self, contact_id: int, contact_data: ContactUpdate, user_id: Optional[int] = None
     ) -> Optional[Contact]:
         """
         Update an existing contact.
@@ -140,6 +129,7 @@ class ContactRepository:
         Args:
             contact_id (int): ID of the contact to update.
             contact_data (ContactUpdate): Updated contact data.
+            user_id (Optional[int]): If given, only update the contact if it belongs to this user.
 
         Returns:
             Optional[Contact]: Updated contact instance or None if not found.
@@ -147,28 +137,36 @@ class ContactRepository:
         Raises:
             HTTPException: If contact not found or update fails.
         """
-        contact = await self.get_contact_by_id(contact_id)
-        if contact is None:
-            raise HTTPException(status_code=404, detail="Contact not found")
-
-        for key, value in contact_data.dict(exclude_unset=True).items():
-            setattr(contact, key, value)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id)
+            .values(**contact_data.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        if user_id is not None:
+            stmt = stmt.where(Contact.user_id == user_id)
 
         try:
+            result = await self.db.execute(stmt)
+            contact = result.scalar_one_or_none()
+            if contact is None:
+                raise HTTPException(status_code=404, detail="Contact not found")
             await self.db.commit()
-            await self.db.refresh(contact)
             return contact
         except IntegrityError:
             await self.db.rollback()
             raise HTTPException(
                 status_code=400, detail="Failed to update contact.")
 
-    async def delete_contact(self, contact_id: int) -> Optional[Contact]:
+    async def delete_contact(
+        self, contact_id: int, user_id: Optional[int] = None
+    ) -> Optional[Contact]:
         """
         Delete a contact by its ID.
 
         Args:
             contact_id (int): ID of the contact to delete.
+            user_id (Optional[int]): If given, only delete the contact if it belongs to this user.
 
         Returns:
             Optional[Contact]: Deleted contact instance or None if not found.
@@ -176,12 +174,15 @@ class ContactRepository:
         Raises:
             HTTPException: If contact not found or delete fails.
         """
-        contact = await self.get_contact_by_id(contact_id)
-        if contact is None:
-            raise HTTPException(status_code=404, detail="Contact not found")
+        stmt = delete(Contact).where(Contact.id == contact_id).returning(Contact)
+        if user_id is not None:
+            stmt = stmt.where(Contact.user_id == user_id)
 
         try:
-            await self.db.delete(contact)
+            result = await self.db.execute(stmt)
+            contact = result.scalar_one_or_none()
+            if contact is None:
+                raise HTTPException(status_code=404, detail="Contact not found")
             await self.db.commit()
             return contact
         except IntegrityError:
@@ -189,25 +190,28 @@ class ContactRepository:
             raise HTTPException(
                 status_code=400, detail="Failed to delete contact.")
 
-    async def search_contacts(self, query: str) -> List[Contact]:
+    async def search_contacts(self, query: str, limit: int = 100) -> List[Contact]:
         """
         Search contacts by query string (first name, last name, or email).
 
         Args:
             query (str): Search query string.
+            limit (int): Max number of records to return.
 
         Returns:
             List[Contact]: List of matching contacts.
         """
-        stmt = select(Contact).filter(
-            (Contact.first_name.ilike(f"%{query}%"))
-            | (Contact.last_name.ilike(f"%{query}%"))
-            | (Contact.email.ilike(f"%{query}%"))
+        stmt = (
+            select(Contact)
+            .filter(contact_search_doc.like(f"%{query.lower()}%"))
+            .limit(limit)
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
-    async def get_upcoming_birthdays(self, days: int, skip: int, limit: int):
+    async def get_upcoming_birthdays(
+        self, days: int, skip: int, limit: int, user_id: Optional[int] = None
+    ):
         """
         Get contacts with upcoming birthdays within a specified number of days.
 
@@ -215,53 +219,65 @@ class ContactRepository:
             days (int): Number of days ahead to check for birthdays.
             skip (int): Number of records to skip.
             limit (int): Max number of records to return.
+            user_id (Optional[int]): If given, only return contacts of this user.
 
         Returns:
-            List[Contact]: List of contacts with upcoming birthdays.
+            dict: Dictionary with total_count, skip, limit, contacts.
         """
         today = date.today()
         future_date = today + timedelta(days=days)
 
+        start = today.month * 100 + today.day
+        end = future_date.month * 100 + future_date.day
+        if end >= start:
+            criteria = Contact.birth_mmdd.between(start, end)
+        else:
+            # The window wraps past December 31st
+            criteria = or_(Contact.birth_mmdd >= start, Contact.birth_mmdd <= end)
+        if user_id is not None:
+            criteria = and_(Contact.user_id == user_id, criteria)
+
+        return await self._paginate(criteria, skip, limit)
+
+    async def _paginate(self, criteria, skip: int, limit: int):
+        """
+        Fetch one page of contacts together with the total match count.
+
+        The total is computed by a ``COUNT(*) OVER ()`` window on the page query,
+        so a single round-trip returns both. Only an empty page past the end or
+        with limit 0, which has no row to carry the window value, falls back to
+        a separate count.
+
+        Args:
+            criteria: SQLAlchemy filter expression for the contacts.
+            skip (int): Number of records to skip.
+            limit (int): Max number of records to return.
+
+        Returns:
+            dict: Dictionary with total_count, skip, limit and contacts, where
+            contacts are rows of CONTACT_RESPONSE_COLUMNS rather than Contact instances.
+        """
         stmt = (
-            select(Contact)
-            .filter(
-                (
-                    (extract("month", Contact.birthday) == today.month)
-                    & (extract("day", Contact.birthday) >= today.day)
-                )
-                | (
-                    (extract("month", Contact.birthday) == future_date.month)
-                    & (extract("day", Contact.birthday) <= future_date.day)
-                )
-            )
+            select(*CONTACT_RESPONSE_COLUMNS, func.count().over().label("total_count"))
+            .where(criteria)
             .offset(skip)
             .limit(limit)
         )
-
-        total_count_stmt = (
-            select(func.count())
-            .select_from(Contact)
-            .filter(
-                (
-                    (extract("month", Contact.birthday) == today.month)
-                    & (extract("day", Contact.birthday) >= today.day)
-                )
-                | (
-                    (extract("month", Contact.birthday) == future_date.month)
-                    & (extract("day", Contact.birthday) <= future_date.day)
-                )
-            )
-        )
-
-        total_count_result = await self.db.execute(total_count_stmt)
-        total_count = total_count_result.scalar()
-
         result = await self.db.execute(stmt)
-        contacts = result.scalars().all()
+        rows = result.all()
+
+        if rows:
+            total_count = rows[0].total_count
+        elif skip or not limit:
+            total_count_stmt = select(func.count()).select_from(Contact).where(criteria)
+            total_count_result = await self.db.execute(total_count_stmt)
+            total_count = total_count_result.scalar()
+        else:
+            total_count = 0
 
         return {
             "total_count": total_count,
             "skip": skip,
             "limit": limit,
-            "contacts": contacts,
+            "contacts": rows,
         }
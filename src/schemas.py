@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 
 class ContactBase(BaseModel):
@@ -51,6 +51,8 @@ class ContactResponse(ContactBase):
         id (int): Contact ID.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
 
 
@@ -65,12 +67,18 @@ class ContactListResponse(BaseModel):
         contacts (List[ContactResponse]): List of contacts.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     total_count: int
     skip: int
     limit: int
     contacts: List[ContactResponse]
 
 
+# Validates and serialises a whole page of contacts in one pydantic-core call
+CONTACT_LIST_ADAPTER = TypeAdapter(List[ContactResponse])
+
+
 class UserCreate(BaseModel):
     """
     Schema for user registration data.
@@ -111,6 +119,8 @@ class UserResponse(BaseModel):
         role (str): User role.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     email: EmailStr
     is_active: bool
@@ -1,8 +1,12 @@
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError
 from typing import Optional
 import os
-import json
+import time
+
+import orjson
+from cachetools import TTLCache
 
 from dotenv import load_dotenv
 
@@ -19,6 +23,11 @@ from src.conf.redis_client import get_redis
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "secret")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", 300))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", 60))
+
+# In-process cache of token -> (user, token exp), checked before any JWT/Redis/DB work
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -33,8 +42,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         str: Encoded JWT token.
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode["exp"] = int(time.time()) + lifetime
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -52,7 +61,7 @@ def decode_access_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
-    except JWTError:
+    except PyJWTError:
         return None
 
 
@@ -71,15 +80,55 @@ async def get_current_user(token: str = Depends(OAuth2PasswordBearer(tokenUrl="/
     Raises:
         HTTPException: If token is invalid or user not found.
     """
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
     payload = decode_access_token(token)
     if payload is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user_id = int(payload.get("sub"))
+    user = await _load_user(int(payload.get("sub")), db)
+    _token_cache[token] = (user, payload.get("exp", 0))
+    return user
+
+
+async def invalidate_user(user_id: int) -> None:
+    """
+    Drop a user's cached record so the next request reloads it from the database.
+
+    Must be called after every write to a user row. Only this process's token
+    cache is purged; other workers drop their entries within TOKEN_CACHE_TTL_SECONDS.
+
+    Args:
+        user_id (int): ID of the user.
+    """
+    for token in [t for t, (user, _) in _token_cache.items() if user.id == user_id]:
+        _token_cache.pop(token, None)
+    redis = await get_redis()
+    await redis.delete(f"user:{user_id}")
+
+
+async def _load_user(user_id: int, db: AsyncSession) -> User:
+    """
+    Load a user from the Redis cache, falling back to the database.
+
+    Args:
+        user_id (int): ID of the user.
+        db (AsyncSession): Database session.
+
+    Returns:
+        User: User instance.
+
+    Raises:
+        HTTPException: If user not found.
+    """
     redis = await get_redis()
     cache_key = f"user:{user_id}"
     cached_user = await redis.get(cache_key)
     if cached_user:
-        user_dict = json.loads(cached_user)
+        user_dict = orjson.loads(cached_user)
+        for field in ("created_at", "updated_at"):
+            if user_dict[field]:
+                user_dict[field] = datetime.fromisoformat(user_dict[field])
         return User(**user_dict)
     result = await db.execute(select(User).where(User.id == user_id))
     db_user = result.scalar_one_or_none()
@@ -91,11 +140,11 @@ async def get_current_user(token: str = Depends(OAuth2PasswordBearer(tokenUrl="/
         "hashed_password": db_user.hashed_password,
         "is_active": db_user.is_active,
         "avatar": db_user.avatar,
-        "created_at": db_user.created_at.isoformat() if db_user.created_at else None,
-        "updated_at": db_user.updated_at.isoformat() if db_user.updated_at else None,
+        "created_at": db_user.created_at,
+        "updated_at": db_user.updated_at,
         "is_verified": db_user.is_verified,
         "verification_token": db_user.verification_token,
         "role": db_user.role,
     }
-    await redis.set(cache_key, json.dumps(user_dict), ex=3600)
+    await redis.set(cache_key, orjson.dumps(user_dict), ex=USER_CACHE_TTL_SECONDS)
     return db_user
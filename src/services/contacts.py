@@ -74,7 +74,9 @@ class ContactService:
         """
         return await self.repo.get_contact_by_id(contact_id)
 
-    async def get_upcoming_birthdays(self, days: int, skip: int, limit: int):
+    async def get_upcoming_birthdays(
+        self, days: int, skip: int, limit: int, user_id: Optional[int] = None
+    ):
         """
         Get contacts with upcoming birthdays within a specified number of days.
 
@@ -82,45 +84,51 @@ class ContactService:
             days (int): Number of days ahead to check for birthdays.
             skip (int): Number of records to skip.
             limit (int): Max number of records to return.
+            user_id (Optional[int]): ID of the user who owns the contacts.
 
         Returns:
             dict: Dictionary with total_count, skip, limit, contacts.
         """
-        return await self.repo.get_upcoming_birthdays(days, skip, limit)
+        return await self.repo.get_upcoming_birthdays(days, skip, limit, user_id)
 
-    async def update_contact(self, contact_id: int, contact_data: ContactUpdate):
+    async def update_contact(
+        self, contact_id: int, contact_data: ContactUpdate, user_id: Optional[int] = None
+    ):
         """
         Update an existing contact.
 
         Args:
             contact_id (int): ID of the contact to update.
             contact_data (ContactUpdate): Updated contact data.
+            user_id (Optional[int]): ID of the user who owns the contact.
 
         Returns:
             Contact: Updated contact instance or None if not found.
         """
-        return await self.repo.update_contact(contact_id, contact_data)
+        return await self.repo.update_contact(contact_id, contact_data, user_id)
 
-    async def delete_contact(self, contact_id: int):
+    async def delete_contact(self, contact_id: int, user_id: Optional[int] = None):
         """
         Delete a contact by its ID.
 
         Args:
             contact_id (int): ID of the contact to delete.
+            user_id (Optional[int]): ID of the user who owns the contact.
 
         Returns:
             Contact: Deleted contact instance or None if not found.
         """
-        return await self.repo.delete_contact(contact_id)
+        return await self.repo.delete_contact(contact_id, user_id)
 
-    async def search_contacts(self, query: str):
+    async def search_contacts(self, query: str, limit: int = 100):
         """
         Search contacts by query string (first name, last name, or email).
 
         Args:
             query (str): Search query string.
+            limit (int): Max number of records to return.
 
         Returns:
             list: List of matching contacts.
         """
-        return await self.repo.search_contacts(query)
+        return await self.repo.search_contacts(query, limit)
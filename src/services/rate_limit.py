@@ -0,0 +1,132 @@
+import math
+import os
+import time
+from typing import Awaitable, Callable, Optional
+
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, status
+from fastapi_limiter.depends import RateLimiter
+
+load_dotenv()
+
+# "memory" keeps buckets per process, so each of WEB_CONCURRENCY workers allows the full
+# limit; use "redis" to enforce one shared limit across workers
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+
+_SHARDS = 16
+_SHARD_MAXSIZE = 4096
+
+
+async def client_identifier(request: Request) -> str:
+    """
+    Build a rate-limit key from the connecting client's address and the path.
+
+    Unlike fastapi_limiter's default_identifier, this ignores X-Forwarded-For,
+    which any caller can rotate to get a fresh bucket per request. Behind a
+    reverse proxy, run uvicorn with --proxy-headers --forwarded-allow-ips so
+    request.client holds the real client address.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        str: Rate-limit identifier of the form "host:path".
+    """
+    host = request.client.host if request.client else "unknown"
+    return f"{host}:{request.scope['path']}"
+
+
+class TokenBucketLimiter:
+    """
+    In-process token-bucket rate limiter usable as a FastAPI dependency.
+
+    Buckets are spread over a fixed number of TTL caches by key hash. A bucket
+    left idle for a full window is back at capacity, so it is simply evicted.
+    """
+
+    def __init__(
+        self,
+        times: int,
+        seconds: int,
+        identifier: Optional[Callable[[Request], Awaitable[str]]] = None,
+    ):
+        """
+        Args:
+            times (int): Bucket capacity, i.e. requests allowed per window.
+            seconds (int): Window length in seconds to refill a full bucket.
+            identifier (Optional[Callable]): Coroutine building the bucket key from a
+                request. Defaults to client_identifier.
+        """
+        self.times = times
+        self.seconds = seconds
+        self.rate = times / seconds
+        self.identifier = identifier or client_identifier
+        self._shards = [
+            TTLCache(maxsize=_SHARD_MAXSIZE, ttl=seconds) for _ in range(_SHARDS)
+        ]
+
+    def _take(self, key: str) -> float:
+        """
+        Take one token from the bucket for a key.
+
+        Runs without awaiting, so the read-modify-write is atomic on the event loop.
+
+        Args:
+            key (str): Bucket key.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        shard = self._shards[hash(key) % _SHARDS]
+        now = time.monotonic()
+        tokens, last = shard.get(key, (self.times, now))
+        tokens = min(self.times, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            shard[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+        shard[key] = (tokens - 1, now)
+        return 0
+
+    async def __call__(self, request: Request):
+        """
+        Reject the request with 429 when its bucket is empty.
+
+        Args:
+            request (Request): FastAPI request object.
+
+        Raises:
+            HTTPException: If the rate limit is exceeded (429).
+        """
+        key = await self.identifier(request)
+        retry_after = self._take(key)
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+def rate_limiter(
+    times: int,
+    seconds: int,
+    identifier: Optional[Callable[[Request], Awaitable[str]]] = None,
+):
+    """
+    Build a rate-limit dependency for the configured backend.
+
+    Args:
+        times (int): Requests allowed per window.
+        seconds (int): Window length in seconds.
+        identifier (Optional[Callable]): Coroutine building the rate-limit key from a
+            request. Defaults to client_identifier for either backend.
+
+    Returns:
+        TokenBucketLimiter | RateLimiter: In-process limiter, or the Redis-backed one
+        when RATE_LIMIT_BACKEND is "redis".
+    """
+    identifier = identifier or client_identifier
+    if RATE_LIMIT_BACKEND == "redis":
+        return RateLimiter(times=times, seconds=seconds, identifier=identifier)
+    return TokenBucketLimiter(times=times, seconds=seconds, identifier=identifier)
@@ -0,0 +1,184 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import bcrypt
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from src.api import auth as auth_api
+from src.conf.redis_client import get_redis
+from src.database.db import get_db
+from src.database.models import User
+from src.main import app
+from src.schemas import UserCreate, UserLogin
+from src.services.auth import get_current_user
+
+CACHED_USER = {
+    "id": 1,
+    "email": "testuser@example.com",
+    "hashed_password": "not-a-real-hash",
+    "is_active": True,
+    "avatar": None,
+    "created_at": None,
+    "updated_at": None,
+    "is_verified": True,
+    "verification_token": None,
+    "role": "user",
+}
+
+
+@pytest.fixture
+def real_auth(client):
+    # Lift the session-wide get_current_user override so requests are authenticated for real
+    override = app.dependency_overrides.pop(get_current_user)
+    yield
+    app.dependency_overrides[get_current_user] = override
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_writes_row_and_invalidates(monkeypatch, make_db):
+    monkeypatch.setattr(
+        auth_api, "cloudinary_upload", lambda *args, **kwargs: {"secure_url": "https://cdn/avatar.png"}
+    )
+    invalidate = AsyncMock()
+    monkeypatch.setattr(auth_api, "invalidate_user", invalidate)
+    db = make_db()
+    # A detached user, as get_current_user returns on a Redis cache hit
+    admin = User(id=5, email="admin@example.com", role="admin")
+
+    result = await auth_api.update_avatar(SimpleNamespace(file=b""), admin, db)
+
+    assert result == {"avatar": "https://cdn/avatar.png"}
+    assert len(db.executed) == 1
+    assert str(db.executed[0]).startswith("UPDATE users SET avatar")
+    assert db.commits == 1
+    invalidate.assert_awaited_once_with(5)
+
+
+async def test_rate_limited_response_carries_retry_after(client):
+    payload = {"email": "throttled@example.com"}
+    for _ in range(5):
+        response = await client.post("/auth/request-password-reset", json=payload)
+        assert response.status_code == 200
+    response = await client.post("/auth/request-password-reset", json=payload)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+
+async def test_lifespan_starts_bcrypt_pool(client):
+    assert auth_api._bcrypt_pool is not None
+    assert auth_api._bcrypt_pool._mp_context.get_start_method() == "spawn"
+
+
+@pytest.mark.parametrize("path", ["/auth/register", "/auth/login"])
+def test_credential_routes_limit_per_ip_and_per_account(path):
+    route = next(r for r in auth_api.router.routes if r.path == path)
+    limiters = {dependency.dependency for dependency in route.dependencies}
+    assert limiters == {auth_api.auth_ip_rate_limit, auth_api.auth_rate_limit}
+
+
+async def test_spoofed_forwarded_for_shares_the_ip_bucket(client, make_db):
+    async def override_get_db():
+        yield make_db()
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        statuses = [
+            (await client.post(
+                "/auth/login",
+                json={"email": f"spray{i}@example.com", "password": "guess"},
+                headers={"X-Forwarded-For": f"10.0.0.{i}"},
+            )).status_code
+            for i in range(25)
+        ]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert statuses[:20] == [401] * 20
+    assert statuses[20:] == [429] * 5
+
+
+async def test_spoofed_forwarded_for_shares_the_account_bucket(client):
+    payload = {"email": "spoofed@example.com"}
+    statuses = [
+        (await client.post(
+            "/auth/request-password-reset", json=payload, headers={"X-Forwarded-For": f"10.1.0.{i}"}
+        )).status_code
+        for i in range(6)
+    ]
+    assert statuses == [200] * 5 + [429]
+
+
+async def test_missing_token_is_rejected(client, real_auth):
+    response = await client.get("/auth/me")
+    assert response.status_code == 401
+
+
+async def test_bad_token_is_rejected(client, real_auth):
+    response = await client.get("/auth/me", headers={"Authorization": "Bearer not.a.jwt"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid token"
+
+
+async def test_minted_token_authenticates(monkeypatch, client, real_auth, auth_headers):
+    # The minted token's user, as _load_user finds it in the Redis user cache
+    monkeypatch.setattr(await get_redis(), "get", AsyncMock(return_value=orjson.dumps(CACHED_USER)))
+    response = await client.get("/auth/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == CACHED_USER["email"]
+
+
+async def test_register_existing_email_conflicts(monkeypatch, make_db):
+    monkeypatch.setattr(auth_api, "_hash_password", AsyncMock(return_value="hashed"))
+    # ON CONFLICT DO NOTHING returns no row for an email that is already taken
+    db = make_db(rows=[])
+    with pytest.raises(HTTPException) as exc:
+        await auth_api.register(UserCreate(email="taken@example.com", password="secret"), db)
+    assert exc.value.status_code == 409
+    assert db.commits == 0
+
+
+async def test_login_wrong_password_is_rejected(make_db):
+    hashed = bcrypt.hashpw(b"right", bcrypt.gensalt(rounds=4)).decode()
+    db = make_db(rows=[SimpleNamespace(id=1, email="user@example.com", hashed_password=hashed)])
+    with pytest.raises(HTTPException) as exc:
+        await auth_api.login(UserLogin(email="user@example.com", password="wrong"), db)
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "Invalid credentials"
+
+
+async def test_verify_email_unknown_token(monkeypatch, make_db):
+    invalidate = AsyncMock()
+    monkeypatch.setattr(auth_api, "invalidate_user", invalidate)
+    # UPDATE ... RETURNING matched no row
+    db = make_db(count=None)
+    with pytest.raises(HTTPException) as exc:
+        await auth_api.verify_email("unknown-token", db)
+    assert exc.value.status_code == 400
+    assert db.commits == 0
+    invalidate.assert_not_awaited()
+
+
+async def test_reset_password_unknown_token(make_db):
+    # DummyRedis.getdel returns None, as for a missing or already used token
+    db = make_db()
+    with pytest.raises(HTTPException) as exc:
+        await auth_api.reset_password("unknown-token", "new-secret", db)
+    assert exc.value.status_code == 400
+    assert db.executed == []
+
+
+async def test_reset_password_updates_and_invalidates(monkeypatch, make_db):
+    monkeypatch.setattr(await get_redis(), "getdel", AsyncMock(return_value=b"user@example.com"))
+    monkeypatch.setattr(auth_api, "_hash_password", AsyncMock(return_value="hashed"))
+    invalidate = AsyncMock()
+    monkeypatch.setattr(auth_api, "invalidate_user", invalidate)
+    db = make_db(count=3)
+
+    result = await auth_api.reset_password("valid-token", "new-secret", db)
+
+    assert result == {"msg": "Password successfully reset"}
+    statement = str(db.executed[0].compile(compile_kwargs={"literal_binds": True}))
+    assert "users.email = 'user@example.com'" in statement
+    assert db.commits == 1
+    invalidate.assert_awaited_once_with(3)
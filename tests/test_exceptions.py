@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
@@ -12,45 +14,58 @@ class DummyRequest:
     url = "http://test/api"
 
 
+REQUEST = DummyRequest()
+
+
 class DummyModel(pydantic.BaseModel):
     field: str
 
 
-@pytest.mark.asyncio
-async def test_integrity_exception_handler():
+def _validation_error() -> ValidationError:
+    try:
+        DummyModel(field=123)
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("DummyModel accepted an int for a str field")
+
+
+VALIDATION_ERROR = _validation_error()
+
+
+# The handlers never really await, so one plain loop for the module is enough
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_integrity_exception_handler(loop):
     exc = IntegrityError("duplicate key", None, None)
-    response = await integrity_exception_handler(DummyRequest(), exc)
+    response = loop.run_until_complete(integrity_exception_handler(REQUEST, exc))
     assert isinstance(response, JSONResponse)
     assert response.status_code == 400
     assert "detail" in response.body.decode()
 
 
-@pytest.mark.asyncio
-async def test_general_exception_handler():
+def test_general_exception_handler(loop):
     exc = Exception("Some error")
-    response = await general_exception_handler(DummyRequest(), exc)
+    response = loop.run_until_complete(general_exception_handler(REQUEST, exc))
     assert isinstance(response, JSONResponse)
     assert response.status_code == 500
     assert "Internal server error" in response.body.decode()
 
 
-@pytest.mark.asyncio
-async def test_validation_exception_handler():
-    class DummyModel(pydantic.BaseModel):
-        field: str
-    try:
-        DummyModel(field=123)
-    except ValidationError as exc:
-        response = await validation_exception_handler(DummyRequest(), exc)
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == 400
-        assert "detail" in response.body.decode()
+def test_validation_exception_handler(loop):
+    response = loop.run_until_complete(validation_exception_handler(REQUEST, VALIDATION_ERROR))
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 400
+    assert "detail" in response.body.decode()
 
 
-@pytest.mark.asyncio
-async def test_not_found_exception_handler():
+def test_not_found_exception_handler(loop):
     exc = HTTPException(status_code=404, detail="Not found")
-    response = await not_found_exception_handler(DummyRequest(), exc)
+    response = loop.run_until_complete(not_found_exception_handler(REQUEST, exc))
     assert isinstance(response, JSONResponse)
     assert response.status_code == 404
     assert "Not found" in response.body.decode()
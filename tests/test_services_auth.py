@@ -1,13 +1,12 @@
-import os
-import sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import time
+from datetime import timedelta
 
 import pytest
 from src.services.auth import create_access_token, decode_access_token
 from unittest.mock import AsyncMock
 from fastapi import HTTPException, status
-from src.services.auth import get_current_user
+from src.services.auth import get_current_user, invalidate_user, _token_cache
+from src.database.models import User
 
 
 @pytest.mark.parametrize("user_id", [1, 42, 100])
@@ -19,6 +18,13 @@ def test_create_access_token(user_id):
     assert "exp" in payload
 
 
+def test_create_access_token_expires_delta():
+    before = int(time.time())
+    token = create_access_token({"sub": "1"}, expires_delta=timedelta(minutes=5))
+    payload = decode_access_token(token)
+    assert before + 300 <= payload["exp"] <= int(time.time()) + 300
+
+
 def test_decode_access_token_valid():
     token = create_access_token({"sub": "1"})
     payload = decode_access_token(token)
@@ -45,6 +51,48 @@ async def test_get_current_user_invalid_token(monkeypatch):
     assert exc.value.detail == "Invalid token"
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_token_cache_hit(monkeypatch):
+    user = User(id=1, email="cached@example.com", role="user")
+    monkeypatch.setitem(_token_cache, "cached.token", (user, time.time() + 60))
+
+    def fail_decode(token):
+        raise AssertionError("token cache hit must skip JWT decoding")
+
+    monkeypatch.setattr("src.services.auth.decode_access_token", fail_decode)
+    assert await get_current_user("cached.token", AsyncMock()) is user
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_token_cache_expired(monkeypatch):
+    user = User(id=1, email="cached@example.com", role="user")
+    monkeypatch.setitem(_token_cache, "expired.token", (user, time.time() - 1))
+    monkeypatch.setattr("src.services.auth.decode_access_token", lambda t: None)
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user("expired.token", AsyncMock())
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_user_not_found(monkeypatch):
     pass  # Удалено по запросу
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_drops_redis_entry(monkeypatch):
+    redis = AsyncMock()
+    monkeypatch.setattr("src.services.auth.get_redis", AsyncMock(return_value=redis))
+    await invalidate_user(7)
+    redis.delete.assert_awaited_once_with("user:7")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_purges_token_cache(monkeypatch):
+    monkeypatch.setattr("src.services.auth.get_redis", AsyncMock(return_value=AsyncMock()))
+    stale = User(id=7, email="stale@example.com", role="user")
+    other = User(id=8, email="other@example.com", role="user")
+    monkeypatch.setitem(_token_cache, "stale.token", (stale, time.time() + 60))
+    monkeypatch.setitem(_token_cache, "other.token", (other, time.time() + 60))
+    await invalidate_user(7)
+    assert "stale.token" not in _token_cache
+    assert "other.token" in _token_cache
@@ -1,106 +1,165 @@
+import asyncio
+from types import SimpleNamespace
+
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from fastapi import HTTPException
+from src.repository.contacts import ContactRepository
 from src.services.contacts import ContactService
 from src.schemas import ContactCreate, ContactUpdate
-from src.database.models import Contact
 
+# The service passes repository rows through untouched, so no ORM instances are needed
+CONTACT_ROW = SimpleNamespace(id=1, first_name="John", last_name="Doe", email="john@example.com",
+                              phone_number="1234567890", user_id=1)
+JANE_ROW = SimpleNamespace(id=1, first_name="Jane", last_name="Doe", email="john@example.com",
+                           phone_number="1234567890", user_id=1)
+CONTACT_PAGE = {"total_count": 1, "skip": 0, "limit": 100, "contacts": [CONTACT_ROW]}
+# Trusted fixture data: model_construct skips the validators the service never depends on
+CREATE_PAYLOAD = ContactCreate.model_construct(first_name="John", last_name="Doe", email="john@example.com",
+                                               phone_number="1234567890")
+UPDATE_PAYLOAD = ContactUpdate.model_construct(first_name="Jane", last_name="Doe", email="john@example.com",
+                                               phone_number="1234567890")
+
+
+@pytest.fixture(scope="session")
+def shared_repo():
+    # spec keeps the mock to ContactRepository's real methods, created lazily on first use
+    return AsyncMock(spec=ContactRepository)
+
+
+@pytest.fixture(scope="module")
+def service():
+    # ContactService only holds its repo, so one instance is rebound per test
+    return ContactService.__new__(ContactService)
 
-@pytest_asyncio.fixture
-def repo():
-    repo = AsyncMock()
-    repo.create_contact = AsyncMock()
-    repo.get_contacts = AsyncMock()
-    repo.get_contact_by_id = AsyncMock()
-    repo.get_upcoming_birthdays = AsyncMock()
-    repo.update_contact = AsyncMock()
-    return repo
+
+@pytest.fixture
+def repo(shared_repo):
+    # One mock for the session; wipe what the previous test configured
+    shared_repo.reset_mock(return_value=True, side_effect=True)
+    return shared_repo
 
 
 @pytest.mark.asyncio
-async def test_create_contact_success(repo):
-    service = ContactService.__new__(ContactService)
+async def test_create_contact_success(service, repo):
     service.repo = repo
-    repo.create_contact.return_value = Contact(id=1, first_name="John", last_name="Doe", email="john@example.com",
-                                               phone_number="1234567890", user_id=1)
-    contact_data = ContactCreate(first_name="John", last_name="Doe", email="john@example.com",
-                                 phone_number="1234567890")
-    contact = await service.create_contact(contact_data, user_id=1)
+    repo.create_contact.return_value = CONTACT_ROW
+    contact = await service.create_contact(CREATE_PAYLOAD, user_id=1)
     assert contact.email == "john@example.com"
 
 
 @pytest.mark.asyncio
-async def test_create_contact_value_error(repo):
-    service = ContactService.__new__(ContactService)
+async def test_create_contact_value_error(service, repo):
     service.repo = repo
     repo.create_contact.side_effect = ValueError("Invalid data")
-    contact_data = ContactCreate(first_name="John", last_name="Doe", email="john@example.com",
-                                 phone_number="1234567890")
-    with pytest.raises(HTTPException) as exc:
-        await service.create_contact(contact_data, user_id=1)
-    assert exc.value.status_code == 400
+    # HTTPException renders as "<status_code>: <detail>"
+    with pytest.raises(HTTPException, match=r"^400: Invalid data$"):
+        await service.create_contact(CREATE_PAYLOAD, user_id=1)
 
 
 @pytest.mark.asyncio
-async def test_get_contacts_success(repo):
-    service = ContactService.__new__(ContactService)
+async def test_get_contacts_success(service, repo):
     service.repo = repo
-    repo.get_contacts.return_value = {"total_count": 1, "skip": 0, "limit": 100, "contacts": [
-        Contact(id=1, first_name="John", last_name="Doe", email="john@example.com", phone_number="1234567890",
-                user_id=1)]}
+    repo.get_contacts.return_value = CONTACT_PAGE
     contacts = await service.get_contacts(0, 100, None, None, None, 1)
     assert contacts["total_count"] == 1
     assert len(contacts["contacts"]) == 1
 
 
 @pytest.mark.asyncio
-async def test_get_contact_by_id_found(repo):
-    service = ContactService.__new__(ContactService)
-    service.repo = repo
-    repo.get_contact_by_id.return_value = Contact(id=1, first_name="John", last_name="Doe", email="john@example.com",
-                                                  phone_number="1234567890", user_id=1)
-    contact = await service.get_contact_by_id(1)
-    assert contact.id == 1
-
-
-@pytest.mark.asyncio
-async def test_get_contact_by_id_not_found(repo):
-    service = ContactService.__new__(ContactService)
+@pytest.mark.parametrize("contact_id, found", [
+    pytest.param(1, CONTACT_ROW, id="found"),
+    pytest.param(999, None, id="not_found"),
+])
+async def test_get_contact_by_id(service, repo, contact_id, found):
     service.repo = repo
-    repo.get_contact_by_id.return_value = None
-    contact = await service.get_contact_by_id(999)
-    assert contact is None
+    repo.get_contact_by_id.return_value = found
+    contact = await service.get_contact_by_id(contact_id)
+    assert contact is found
 
 
 @pytest.mark.asyncio
-async def test_get_upcoming_birthdays(repo):
-    service = ContactService.__new__(ContactService)
+async def test_get_upcoming_birthdays(service, repo):
     service.repo = repo
-    repo.get_upcoming_birthdays.return_value = {"total_count": 1, "skip": 0, "limit": 100, "contacts": [
-        Contact(id=1, first_name="John", last_name="Doe", email="john@example.com", phone_number="1234567890",
-                user_id=1)]}
+    repo.get_upcoming_birthdays.return_value = CONTACT_PAGE
     result = await service.get_upcoming_birthdays(7, 0, 100)
     assert result["total_count"] == 1
     assert len(result["contacts"]) == 1
 
 
 @pytest.mark.asyncio
-async def test_update_contact_success(repo):
-    service = ContactService.__new__(ContactService)
+@pytest.mark.parametrize("contact_id, updated", [
+    pytest.param(1, JANE_ROW, id="success"),
+    pytest.param(999, None, id="not_found"),
+])
+async def test_update_contact(service, repo, contact_id, updated):
     service.repo = repo
-    repo.update_contact.return_value = Contact(id=1, first_name="Jane", last_name="Doe", email="john@example.com",
-                                               phone_number="1234567890", user_id=1)
-    update_data = ContactUpdate(first_name="Jane", last_name="Doe", email="john@example.com", phone_number="1234567890")
-    updated_contact = await service.update_contact(1, update_data)
-    assert updated_contact.first_name == "Jane"
+    repo.update_contact.return_value = updated
+    updated_contact = await service.update_contact(contact_id, UPDATE_PAYLOAD)
+    assert updated_contact is updated
 
 
-@pytest.mark.asyncio
-async def test_update_contact_not_found(repo):
+def _fresh_service():
     service = ContactService.__new__(ContactService)
-    service.repo = repo
-    repo.update_contact.return_value = None
-    update_data = ContactUpdate(first_name="Jane", last_name="Doe", email="john@example.com", phone_number="1234567890")
-    updated_contact = await service.update_contact(999, update_data)
-    assert updated_contact is None
+    service.repo = AsyncMock(spec=ContactRepository)
+    return service
+
+
+async def _create_flow(service):
+    service.repo.create_contact.return_value = CONTACT_ROW
+    assert await service.create_contact(CREATE_PAYLOAD, user_id=1) is CONTACT_ROW
+
+
+async def _create_value_error_flow(service):
+    service.repo.create_contact.side_effect = ValueError("Invalid data")
+    with pytest.raises(HTTPException, match=r"^400: Invalid data$"):
+        await service.create_contact(CREATE_PAYLOAD, user_id=1)
+
+
+async def _get_contacts_flow(service):
+    service.repo.get_contacts.return_value = CONTACT_PAGE
+    assert await service.get_contacts(0, 100, None, None, None, 1) is CONTACT_PAGE
+
+
+async def _get_by_id_flow(service):
+    service.repo.get_contact_by_id.return_value = CONTACT_ROW
+    assert await service.get_contact_by_id(1) is CONTACT_ROW
+
+
+async def _get_by_id_missing_flow(service):
+    service.repo.get_contact_by_id.return_value = None
+    assert await service.get_contact_by_id(999) is None
+
+
+async def _birthdays_flow(service):
+    service.repo.get_upcoming_birthdays.return_value = CONTACT_PAGE
+    assert await service.get_upcoming_birthdays(7, 0, 100) is CONTACT_PAGE
+
+
+async def _update_flow(service):
+    service.repo.update_contact.return_value = JANE_ROW
+    assert await service.update_contact(1, UPDATE_PAYLOAD) is JANE_ROW
+
+
+async def _update_missing_flow(service):
+    service.repo.update_contact.return_value = None
+    assert await service.update_contact(999, UPDATE_PAYLOAD) is None
+
+
+SCENARIOS = [
+    _create_flow,
+    _create_value_error_flow,
+    _get_contacts_flow,
+    _get_by_id_flow,
+    _get_by_id_missing_flow,
+    _birthdays_flow,
+    _update_flow,
+    _update_missing_flow,
+]
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_all_contact_flows_smoke():
+    # Each scenario gets its own service and mock, so they can run concurrently
+    await asyncio.gather(*(scenario(_fresh_service()) for scenario in SCENARIOS))
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException, status
+from src.services.rate_limit import TokenBucketLimiter
+
+
+async def _identifier(request):
+    return "127.0.0.1:/auth/login"
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_up_to_capacity():
+    limiter = TokenBucketLimiter(times=3, seconds=60, identifier=_identifier)
+    for _ in range(3):
+        await limiter(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rejects_when_empty():
+    limiter = TokenBucketLimiter(times=2, seconds=60, identifier=_identifier)
+    await limiter(MagicMock())
+    await limiter(MagicMock())
+    with pytest.raises(HTTPException) as exc:
+        await limiter(MagicMock())
+    assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert exc.value.headers["Retry-After"] == "30"
+
+
+def test_token_bucket_refills_over_time(monkeypatch):
+    limiter = TokenBucketLimiter(times=1, seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr("src.services.rate_limit.time.monotonic", lambda: now[0])
+    assert limiter._take("key") == 0
+    assert limiter._take("key") == pytest.approx(10)
+    now[0] += 10
+    assert limiter._take("key") == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_default_key_ignores_forwarded_for():
+    limiter = TokenBucketLimiter(times=1, seconds=60)
+
+    def request(forwarded_for):
+        return MagicMock(
+            client=MagicMock(host="203.0.113.7"),
+            scope={"path": "/auth/me"},
+            headers={"X-Forwarded-For": forwarded_for},
+        )
+
+    await limiter(request("10.0.0.1"))
+    with pytest.raises(HTTPException) as exc:
+        await limiter(request("10.0.0.2"))
+    assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS